@@ -2,15 +2,20 @@
 
 import numpy as np
 import matplotlib.pyplot as plt
-from scipy import stats as st
 
 from neurodsp.plts import plot_time_series, plot_bursts
 from neurodsp.plts.utils import check_ax
 
+from scipy.special import ndtr
+
 from bycycle.utils.dataframes import get_extrema_df
 from bycycle.utils.timeseries import limit_signal
 from bycycle.spikes.utils import split_signal
-from neurodsp.sim.cycles import sim_skewed_gaussian_cycle
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
 
 ###################################################################################################
 ###################################################################################################
@@ -43,11 +48,13 @@ def plot_spikes(df_features, sig, fs, spikes=None, index=None, xlim=None, ax=Non
     # Plot a single spike
     if index is not None:
 
-        times = np.arange(0, len(sig)/fs, 1/fs)
+        times = _times(len(sig), fs)
+
+        # Get where spike starts/ends, pulling the row once
+        row = df_features.iloc[index]
 
-        # Get where spike starts/ends
-        start = df_features.iloc[index]['sample_start'].astype(int)
-        end = df_features.iloc[index]['sample_end'].astype(int)
+        start = int(row['sample_start'])
+        end = int(row['sample_end'])
 
         sig_lim = sig[start:end+1]
         times_lim = times[start:end+1]
@@ -55,21 +62,24 @@ def plot_spikes(df_features, sig, fs, spikes=None, index=None, xlim=None, ax=Non
         # Plot the spike waveform
         plot_time_series(times_lim, sig_lim, ax=ax)
 
-        # Plot cyclespoints
+        # Plot cyclespoints as one scatter, rather than one wrapped call per point
         labels, keys = _infer_labels(center_e)
-        colors = ['C0', 'C1', 'C2', 'C3']
+        colors = ['C0', 'C1', 'C2', 'C3'][:len(keys)]
 
-        for idx, key in enumerate(keys):
+        samples = np.array([int(row[key]) for key in keys])
 
-            sample = df_features.iloc[index][key].astype('int')
+        ax.scatter(times[samples], sig[samples], c=colors, zorder=5)
 
-            plot_time_series(np.array([times[sample]]), np.array([sig[sample]]),
-                             colors=colors[idx], labels=labels[idx], ls='', marker='o', ax=ax)
+        # Empty plots give the scatter one legend entry per cyclepoint
+        for label, color in zip(labels, colors):
+            ax.plot([], [], 'o', color=color, label=label)
+
+        ax.legend()
 
     # Plot as stack of spikes
     elif index is None and spikes is not None:
 
-        times = np.arange(0, len(spikes[0])/fs, 1/fs)
+        times = _times(len(spikes[0]), fs)
 
         plot_time_series(times, spikes, ax=ax)
 
@@ -78,7 +88,7 @@ def plot_spikes(df_features, sig, fs, spikes=None, index=None, xlim=None, ax=Non
 
         ax = check_ax(ax, (15, 3))
 
-        times = np.arange(0, len(sig)/fs, 1/fs)
+        times = _times(len(sig), fs)
 
         plot_time_series(times, sig, ax=ax, xlim=xlim)
 
@@ -86,60 +96,128 @@ def plot_spikes(df_features, sig, fs, spikes=None, index=None, xlim=None, ax=Non
             sig_lim = sig
             df_lim = df_features
             times_lim = times
-            starts = df_lim['sample_start']
         else:
-            cyc_idxs = (df_features['sample_start'].values >= xlim[0] * fs) & \
-                    (df_features['sample_end'].values <= xlim[1] * fs)
+            # Window limits in samples, computed once
+            lo_n = int(xlim[0] * fs)
+            hi_n = int(xlim[1] * fs)
+
+            # Cyclepoints are sorted, so binary search for the cycles inside the
+            #   window and take a zero-copy slice instead of masking every row
+            lo = np.searchsorted(df_features['sample_start'].values, lo_n, side='left')
+            hi = np.searchsorted(df_features['sample_end'].values, hi_n, side='right')
 
-            df_lim = df_features.iloc[cyc_idxs].copy()
+            df_lim = df_features.iloc[lo:hi]
 
             sig_lim, times_lim = limit_signal(times, sig, start=xlim[0], stop=xlim[1])
 
-            starts = df_lim['sample_start'] - int(fs * xlim[0])
+        # Pull cyclepoints out once as contiguous int arrays, so the mask math
+        #   below runs on plain ndarrays rather than pandas Series. The copy
+        #   keeps the in-place ops below from mutating df_features
+        starts = df_lim['sample_start'].to_numpy(dtype=np.int64, copy=True)
+        ends = starts + df_lim['period'].to_numpy(dtype=np.int64)
 
-        ends = starts + df_lim['period'].values
+        if xlim is not None:
+            starts -= lo_n
+            ends -= lo_n
 
-        is_spike = np.zeros(len(sig_lim), dtype='bool')
+        # Clip to the signal, since out-of-range scatters raise, unlike slices
+        np.clip(starts, 0, len(sig_lim), out=starts)
+        np.clip(ends, 0, len(sig_lim), out=ends)
 
-        for start, end in zip(starts, ends):
-            is_spike[start:end] = True
+        # Mark spike samples with a boundary-diff: scatter +1/-1 at cycle edges,
+        #   then a cumulative sum recovers the in-spike mask in one pass
+        if njit is not None:
+            is_spike = _compute_is_spike(starts, ends, len(sig_lim))
+        else:
+            delta = np.zeros(len(sig_lim) + 1, dtype=np.int32)
+            np.add.at(delta, starts, 1)
+            np.add.at(delta, ends, -1)
+
+            is_spike = np.cumsum(delta)[:-1] > 0
 
         plot_bursts(times_lim, sig_lim, is_spike, ax=ax)
 
 
+# Static (labels, keys) pairs for each center extrema
+_LABELS = {
+    'trough': (['Trough', 'Peak', 'Inflection'],
+               ['sample_trough', 'sample_next_peak', 'sample_end']),
+    'peak': (['Peak', 'Trough', 'Inflection'],
+             ['sample_peak', 'sample_next_trough', 'sample_end'])
+}
+
+
 def _infer_labels(center_e):
     """Create labels based on center extrema."""
 
-    # Infer labels
-    if center_e == 'trough':
-        labels = ['Trough', 'Peak', 'Inflection']
-        keys = ['sample_trough', 'sample_next_peak', 'sample_end']
-    elif center_e == 'peak':
-        labels = ['Peak', 'Trough', 'Inflection']
-        keys = ['sample_peak', 'sample_next_trough', 'sample_end']
+    try:
+        return _LABELS[center_e]
+    except KeyError:
+        raise ValueError("The center extrema must be either 'trough' or 'peak'.") from None
 
-    return labels, keys
 
-def plot_gaussian_fit(df_features, sig, fs, z_thresh_cond, z_thresh_k):
+def _times(n_samples, fs):
+    """Create a times vector from integer sample indices.
 
-    # Get where spike starts/ends
-    start = df_features['sample_start'].astype(int)
-    end = df_features['sample_end'].astype(int)
+    Integer arange plus one vector divide avoids the off-by-one lengths a
+    float-stepped arange can produce.
+    """
+
+    return np.arange(n_samples, dtype=np.float64) / fs
+
+
+def _zscore(sig):
+    """Z-score a signal in a single vectorized pass."""
+
+    return (sig - sig.mean()) / sig.std()
+
+
+def _skewed_gauss_from_t(t, center, std, alpha, height):
+    """Simulate a skewed gaussian cycle on a prebuilt normalized time grid.
+
+    Matches neurodsp's sim_skewed_gaussian_cycle, but accepts ``t``, a
+    linspace over [0, 1], rather than rebuilding the grid per call, and
+    skews with the standard normal cdf directly.
+    """
+
+    cycle = np.exp(-(t - center)**2 / (2 * std**2))
+
+    # Skew the gaussian; 2 * (t - center) recenters the [-1, 1] cdf grid
+    cycle = cycle * ndtr(alpha * 2 * (t - center) / std)
+
+    # Rescale height
+    return (cycle / np.max(cycle)) * height
+
+def plot_gaussian_fit(df_features, sig, fs, z_thresh_cond, z_thresh_k, axes=None):
+
+    # Draw all steps into one figure, rather than one render per step
+    if axes is None:
+        _, axes = plt.subplots(6, 1, figsize=(10, 18))
+
+    # Pull every needed scalar out of the row once, rather than one pandas
+    #   lookup per use below
+    start = int(df_features['sample_start'])
+    end = int(df_features['sample_end'])
+
+    na_c, na_s, na_a, na_h = (float(df_features['Na_center']), float(df_features['Na_std']),
+                              float(df_features['Na_alpha']), float(df_features['Na_height']))
+    cond_c, cond_s, cond_a, cond_h = \
+        (float(df_features['Cond_center']), float(df_features['Cond_std']),
+         float(df_features['Cond_alpha']), float(df_features['Cond_height']))
+    k_c, k_s, k_a, k_h = (float(df_features['K_center']), float(df_features['K_std']),
+                          float(df_features['K_alpha']), float(df_features['K_height']))
 
     # Calculate signal parameters
     sig_cyc = sig[start:end+1]
     cyc_len = len(sig_cyc)
-    times_cyc = np.arange(0, cyc_len/fs, 1/fs)
+    times_cyc = _times(cyc_len, fs)
 
-    # Get calculated gaussian paramters
-    na_params = [cyc_len/fs, fs, df_features['Na_center'], df_features['Na_std'],
-                 df_features['Na_alpha'], df_features['Na_height']]
-
-    na_gaus = sim_skewed_gaussian_cycle(*na_params)
+    # Simulate the Na gaussian on a prebuilt normalized grid
+    na_gaus = _skewed_gauss_from_t(np.linspace(0, 1, cyc_len), na_c, na_s, na_a, na_h)
     # Plot Na gaussian fit
-    plot_sing_gaus(na_gaus, sig_cyc, current_type="Na")
+    plot_sing_gaus(na_gaus, sig_cyc, current_type="Na", ax=axes[0])
 
-    na_center = int(df_features['Na_center']*cyc_len)
+    na_center = int(na_c*cyc_len)
     # Get remaining signal for plotting
     rem_sig = sig_cyc - na_gaus
     rem_sig_k = rem_sig[na_center :,]
@@ -147,83 +225,165 @@ def plot_gaussian_fit(df_features, sig, fs, z_thresh_cond, z_thresh_k):
     times_k = times_cyc[na_center :,]
     times_cond = times_cyc[:na_center ,]
 
+    # Since times_cyc is arange(cyc_len) / fs, fs * times_cyc is just the sample
+    #   indices - plot against those directly instead of re-multiplying per call
+    samples_cyc = np.arange(cyc_len, dtype=np.float64)
+    samples_k = samples_cyc[na_center :,]
+    samples_cond = samples_cyc[:na_center ,]
+
     # Plot remaining signal
-    plt.plot(fs*times_k,rem_sig_k, label="K current region", color="b")
-    plt.plot(fs*times_cond,rem_sig_cond, label="Conductive current region", color="green")
-    plt.axvline(na_center, color='k')
-    plt.title("Remaining signal after subtracting Na current gaussian fit")
-    plt.legend()
-    plt.ylabel("Voltage (uV)")
-    plt.show()
+    axes[1].plot(samples_k, rem_sig_k, label="K current region", color="b")
+    axes[1].plot(samples_cond, rem_sig_cond, label="Conductive current region", color="green")
+    axes[1].axvline(na_center, color='k')
+    axes[1].set_title("Remaining signal after subtracting Na current gaussian fit")
+    axes[1].legend()
+    axes[1].set_ylabel("Voltage (uV)")
 
     # Calculate z scores
-    z_score_k = st.zscore(rem_sig_k)
-    z_score_cond = st.zscore(rem_sig_cond)
-
-    plt.plot(fs*times_k,z_score_k, label="K current region z-score", color="b")
-    plt.plot(fs*times_cond,z_score_cond, label="Conductive current region z-score", color="green")
-    plt.plot(fs*times_k, np.array([z_thresh_k for i in range(len(times_k))]), 'k--')
-    plt.axvline(na_center, color='k')
-    plt.plot(fs*times_cond, np.array([z_thresh_cond for i in range(len(times_cond))]), 'k--')
-    plt.title("Remaining signal z-scores")
-    plt.ylabel("Z-score")
-    plt.legend()
-    plt.show()
-
-    cond_params = [len(rem_sig_cond)/fs, fs, df_features['Cond_center'],
-                   df_features['Cond_std'], df_features['Cond_alpha'], df_features['Cond_height']]
-    k_params = [len(rem_sig_k)/fs, fs, df_features['K_center'],
-                df_features['K_std'], df_features['K_alpha'], df_features['K_height'] ]
+    z_score_k = _zscore(rem_sig_k)
+    z_score_cond = _zscore(rem_sig_cond)
+
+    axes[2].plot(samples_k, z_score_k, label="K current region z-score", color="b")
+    axes[2].plot(samples_cond, z_score_cond, label="Conductive current region z-score",
+                 color="green")
+    axes[2].plot(samples_k, np.full_like(times_k, z_thresh_k), 'k--')
+    axes[2].axvline(na_center, color='k')
+    axes[2].plot(samples_cond, np.full_like(times_cond, z_thresh_cond), 'k--')
+    axes[2].set_title("Remaining signal z-scores")
+    axes[2].set_ylabel("Z-score")
+    axes[2].legend()
 
     # Get current gaussians based on fit parameters
-    cond_gaus = sim_skewed_gaussian_cycle(*cond_params)
-    k_gaus = sim_skewed_gaussian_cycle(*k_params)
+    cond_gaus = _skewed_gauss_from_t(np.linspace(0, 1, len(rem_sig_cond)),
+                                     cond_c, cond_s, cond_a, cond_h)
+    k_gaus = _skewed_gauss_from_t(np.linspace(0, 1, len(rem_sig_k)), k_c, k_s, k_a, k_h)
 
     # Plot conductive and potassium current fits
-    plot_sing_gaus(cond_gaus, rem_sig_cond, current_type="Conductive")
-    plot_sing_gaus(k_gaus, rem_sig_k, current_type="K")
+    plot_sing_gaus(cond_gaus, rem_sig_cond, current_type="Conductive", ax=axes[3])
+    plot_sing_gaus(k_gaus, rem_sig_k, current_type="K", ax=axes[4])
 
     # Plot all gaussian fits
-    plt.plot(sig_cyc, label= "cycle signal", color="k")
-    plt.plot(na_gaus)
-    plt.plot(fs*times_k, k_gaus)
-    plt.plot(fs*times_cond, cond_gaus)
-    plt.ylabel("Voltage (uV)")
-    plt.title("All gaussian fits found")
+    axes[5].plot(sig_cyc, label= "cycle signal", color="k")
+    axes[5].plot(na_gaus)
+    axes[5].plot(samples_k, k_gaus)
+    axes[5].plot(samples_cond, cond_gaus)
+    axes[5].set_ylabel("Voltage (uV)")
+    axes[5].set_title("All gaussian fits found")
+
     plt.show()
 
 
-def plot_sing_gaus(gaus, sig, current_type="Na"):
-    plt.plot(gaus, label= "skewed gaussian fit", color="red")
-    plt.plot(sig, label= "cycle signal", color="k")
-    plt.title(current_type + " current gaussian fit")
-    plt.ylabel("Voltage (uV)")
-    plt.legend()
-    plt.show()
+def plot_sing_gaus(gaus, sig, current_type="Na", ax=None):
+
+    ax = check_ax(ax, (10, 4))
+
+    ax.plot(gaus, label= "skewed gaussian fit", color="red")
+    ax.plot(sig, label= "cycle signal", color="k")
+    ax.set_title(current_type + " current gaussian fit")
+    ax.set_ylabel("Voltage (uV)")
+    ax.legend()
 
-def plot_gen_spikes(fs, spikes_gen, index, xlim, ax):
+def plot_gen_spikes(fs, spikes_gen, index, xlim, ax=None):
+
+    ax = check_ax(ax, (10, 4))
 
     #plot single spike
     if index is not None:
-        times = range(1,1+ len(spikes_gen[index]))
-        plot_times = [x/fs for x in times]
-        plt.plot(plot_times, spikes_gen[index])
-        plt.ylabel("Voltage (uV)")
+        times = np.arange(1, 1 + len(spikes_gen[index])) / fs
+        ax.plot(times, spikes_gen[index])
+        ax.set_ylabel("Voltage (uV)")
 
     else:
-        #plot all spikes 
-        #get Na current trough for first generated spike 
-        align_point = np.argmin(spikes_gen[0])/fs
-
-        for i in range(len(spikes_gen)):
-            #get trough of Na current for each spike
-            trough = np.argmin(spikes_gen[i])/fs
-            #calculate shift between the trough and the align point
-            shift = trough - align_point
-           
-            times = range(1,1+ len(spikes_gen[i]))
-            #get aligned time array
-            align_times = [(x/fs)-shift for x in times]
-
-            plt.plot(align_times, spikes_gen[i])
-            plt.ylabel("Voltage (uV)")
+        #plot all spikes
+        lengths = set(len(spike) for spike in spikes_gen)
+
+        if len(lengths) == 1:
+            #compute all aligned time arrays at once, on the stacked 2d array
+            stack = np.ascontiguousarray(np.vstack(spikes_gen))
+
+            if njit is not None:
+                align_times = _compute_align_times(stack, fs)
+            else:
+                #one row-wise argmin reduction instead of a Python call per spike
+                troughs = np.argmin(stack, axis=1) / fs
+                shifts = troughs - troughs[0]
+                align_times = (np.arange(1, stack.shape[1] + 1) / fs)[None, :] - shifts[:, None]
+
+            for i in range(len(spikes_gen)):
+                ax.plot(align_times[i], stack[i])
+
+        else:
+            #get Na current trough for first generated spike
+            align_point = np.argmin(spikes_gen[0])/fs
+
+            for i in range(len(spikes_gen)):
+                #get trough of Na current for each spike
+                trough = np.argmin(spikes_gen[i])/fs
+                #calculate shift between the trough and the align point
+                shift = trough - align_point
+
+                times = np.arange(1, 1 + len(spikes_gen[i])) / fs
+                #get aligned time array
+                align_times = times - shift
+
+                ax.plot(align_times, spikes_gen[i])
+
+        ax.set_ylabel("Voltage (uV)")
+
+
+def _compute_align_times(spikes_gen, fs):
+    """Compute trough-aligned time arrays for a stack of generated spikes."""
+
+    n_spikes, n_samples = spikes_gen.shape
+
+    align_times = np.empty((n_spikes, n_samples))
+
+    align_point = np.argmin(spikes_gen[0]) / fs
+
+    for i in range(n_spikes):
+
+        # Single-pass trough search for the current spike
+        trough_idx = 0
+        for j in range(1, n_samples):
+            if spikes_gen[i, j] < spikes_gen[i, trough_idx]:
+                trough_idx = j
+
+        shift = trough_idx / fs - align_point
+
+        for j in range(n_samples):
+            align_times[i, j] = (j + 1) / fs - shift
+
+    return align_times
+
+def _compute_is_spike(starts, ends, n_samples):
+    """Compute a boolean spike mask from cycle start/end samples."""
+
+    delta = np.zeros(n_samples + 1, dtype=np.int32)
+
+    for ind in range(starts.shape[0]):
+
+        start = starts[ind]
+        end = ends[ind]
+
+        if start < 0:
+            start = 0
+        if end > n_samples:
+            end = n_samples
+
+        if start < end:
+            delta[start] += 1
+            delta[end] -= 1
+
+    # Sequential prefix-sum recovers the overlap-tolerant mask
+    is_spike = np.empty(n_samples, dtype=np.bool_)
+
+    acc = 0
+    for ind in range(n_samples):
+        acc += delta[ind]
+        is_spike[ind] = acc > 0
+
+    return is_spike
+
+if njit is not None:
+    _compute_align_times = njit(cache=True, fastmath=True)(_compute_align_times)
+    _compute_is_spike = njit(cache=True)(_compute_is_spike)